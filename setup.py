@@ -1,7 +1,8 @@
+import pathlib
+
 import setuptools
 
-with open("README.md", "r") as fh:
-    long_description = fh.read()
+long_description = pathlib.Path(__file__).with_name("README.md").read_text(encoding="utf-8")
 
 setuptools.setup(
     name="cloud-runtimes-python",
@@ -12,7 +13,8 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/reactivegroup/cloud-runtimes-python",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(include=["api", "api.*"], exclude=["tests", "tests.*", "docs", "benchmarks"]),
+    zip_safe=False,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",